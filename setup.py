@@ -0,0 +1,12 @@
+import os
+
+from setuptools import setup
+
+# Opt-in ahead-of-time compilation of the decorators with mypyc. The pure-Python module stays the default.
+ext_modules = []
+if os.environ.get("WRAPPER_UTILS_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["wrapper_utils/wrapper_utils.py"])
+
+setup(ext_modules=ext_modules)
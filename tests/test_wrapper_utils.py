@@ -0,0 +1,293 @@
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import wrapper_utils.wrapper_utils as wu
+from wrapper_utils import catch, decorator, repeat, threaded_repeat, timeit
+
+
+class Counter:
+    """Thread-safe call counter that returns the running count from each call."""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            self.calls += 1
+            return self.calls
+
+
+@pytest.fixture
+def fresh_default_pool(monkeypatch):
+    """Reset the lazily created default pool and shut down whatever the test creates."""
+    monkeypatch.setattr(wu, "_DEFAULT_POOL", None)
+    yield
+    if wu._DEFAULT_POOL is not None:
+        wu._DEFAULT_POOL.shutdown()
+
+
+# repeat
+
+def test_repeat_calls_n_times_and_returns_last_result():
+    counter = Counter()
+    assert repeat(n=3)(counter)() == 3
+    assert counter.calls == 3
+
+
+def test_repeat_n_one_returns_function_unchanged():
+    def f():
+        pass
+
+    assert repeat(n=1)(f) is f
+
+
+@pytest.mark.parametrize("n", [0, -2])
+def test_repeat_non_positive_n_never_calls(n):
+    counter = Counter()
+    assert repeat(n=n)(counter)() is None
+    assert counter.calls == 0
+
+
+def test_repeat_forwards_underscore_keywords():
+    wrapped = repeat(n=2)(lambda **kwargs: kwargs)
+    assert wrapped(_count=5, _func=1) == {"_count": 5, "_func": 1}
+
+
+def test_wrapper_keeps_metadata_and_annotations():
+    def ann(x: int) -> int:
+        """Docs."""
+        return x
+
+    wrapped = repeat(n=2)(ann)
+    assert wrapped.__name__ == "ann"
+    assert wrapped.__doc__ == "Docs."
+    assert wrapped.__annotations__ == {"x": int, "return": int}
+    assert wrapped.__wrapped__ is ann
+
+
+# threaded_repeat
+
+def test_threaded_repeat_n_one_default_pool_returns_function_unchanged():
+    def f():
+        pass
+
+    assert threaded_repeat(n=1)(f) is f
+
+
+def test_threaded_repeat_n_one_uses_explicit_executor():
+    with ThreadPoolExecutor(thread_name_prefix="mine") as pool:
+        name = threaded_repeat(n=1, executor=pool)(lambda: threading.current_thread().name)()
+    assert name.startswith("mine")
+
+
+@pytest.mark.parametrize("mode", ["each", "chunk"])
+def test_threaded_repeat_runs_every_call(mode):
+    counter = Counter()
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        wrapped = threaded_repeat(n=10, executor=pool, mode=mode)(counter)
+        assert 1 <= wrapped(1, key="value") <= 10
+    assert counter.calls == 10
+
+
+def test_threaded_repeat_chunk_returns_last_call_result():
+    # A single worker gets a single chunk, so the last call is also the last one to run
+    counter = Counter()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert threaded_repeat(n=7, executor=pool, mode="chunk")(counter)() == 7
+
+
+def test_chunk_sizes_split_evenly_with_larger_chunks_first():
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        assert wu._chunk_sizes(10, pool) == [4, 3, 3]
+        assert wu._chunk_sizes(2, pool) == [1, 1]
+        assert wu._chunk_sizes(0, pool) == []
+
+
+def test_threaded_repeat_chunk_uses_default_pool(fresh_default_pool):
+    counter = Counter()
+    wrapped = threaded_repeat(n=5, mode="chunk")(counter)
+    assert wu._DEFAULT_POOL is None
+    wrapped()
+    wrapped()
+    assert counter.calls == 10
+    assert wu._DEFAULT_POOL is not None
+
+
+@pytest.mark.parametrize("mode", ["each", "chunk"])
+def test_threaded_repeat_reraises(mode):
+    def boom():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        threaded_repeat(n=4, mode=mode)(boom)()
+
+
+@pytest.mark.parametrize("mode", ["each", "chunk"])
+def test_threaded_repeat_non_positive_n_returns_none(mode):
+    counter = Counter()
+    assert threaded_repeat(n=0, mode=mode)(counter)() is None
+    assert counter.calls == 0
+
+
+def test_threaded_repeat_rejects_unknown_mode():
+    with pytest.raises(ValueError, match="mode"):
+        threaded_repeat(n=2, mode="bogus")
+
+
+def test_default_pool_is_created_lazily(fresh_default_pool):
+    wrapped = threaded_repeat(n=2)(lambda: threading.current_thread().name)
+    assert wu._DEFAULT_POOL is None
+    assert wrapped().startswith("wu")
+    assert wu._DEFAULT_POOL is not None
+
+
+def test_default_pool_honours_max_workers_env(fresh_default_pool, monkeypatch):
+    monkeypatch.setenv("WRAPPER_UTILS_MAX_WORKERS", "3")
+    assert wu._get_default_pool()._max_workers == 3
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "lots"])
+def test_default_pool_ignores_invalid_max_workers_env(fresh_default_pool, monkeypatch, caplog, value):
+    monkeypatch.setenv("WRAPPER_UTILS_MAX_WORKERS", value)
+    with caplog.at_level(logging.WARNING, logger="wrapper_utils.wrapper_utils"):
+        pool = wu._get_default_pool()
+    assert pool._max_workers == wu._default_max_workers()
+    assert pool._max_workers > 0
+    assert "WRAPPER_UTILS_MAX_WORKERS" in caplog.text
+
+
+# catch
+
+def _divide(a, b):
+    return a / b
+
+
+def test_catch_logs_exception(caplog):
+    with caplog.at_level(logging.ERROR, logger="wrapper_utils.wrapper_utils"):
+        assert catch(_divide)(1, 0) is None
+    (record,) = caplog.records
+    assert record.getMessage() == "caught in _divide"
+    assert record.exc_info[0] is ZeroDivisionError
+
+
+def test_catch_silent_logs_nothing(caplog):
+    with caplog.at_level(logging.DEBUG, logger="wrapper_utils.wrapper_utils"):
+        assert catch(silent=True)(_divide)(1, 0) is None
+    assert caplog.records == []
+
+
+def test_catch_calls_handler_instead_of_logging(caplog):
+    seen = []
+    with caplog.at_level(logging.DEBUG, logger="wrapper_utils.wrapper_utils"):
+        catch(handler=seen.append)(_divide)(1, 0)
+    assert isinstance(seen[0], ZeroDivisionError)
+    assert caplog.records == []
+
+
+def test_catch_accepts_list_and_lets_others_through():
+    wrapped = catch(exception=[ZeroDivisionError, KeyError], silent=True)(_divide)
+    assert wrapped(1, 0) is None
+    assert wrapped(4, 2) == 2
+    with pytest.raises(TypeError):
+        wrapped(1, "x")
+
+
+def test_catch_forwards_underscore_keywords():
+    def f(**kwargs):
+        raise KeyError(kwargs)
+
+    seen = []
+    catch(exception=KeyError, handler=seen.append)(f)(_handler=1, _exception=ValueError)
+    assert seen[0].args[0] == {"_handler": 1, "_exception": ValueError}
+
+
+# timeit
+
+def test_timeit_passes_seconds_to_handler_for_float_clock():
+    seen = []
+    timeit(timer=time.perf_counter, handler=lambda name, secs: seen.append((name, secs)))(time.sleep)(0.01)
+    (name, secs), = seen
+    assert name == "sleep"
+    assert isinstance(secs, float)
+    assert 0.005 < secs < 1
+
+
+def test_timeit_default_clock_reports_seconds():
+    seen = []
+    timeit(handler=lambda name, secs: seen.append(secs))(time.sleep)(0.01)
+    assert 0.005 < seen[0] < 1
+
+
+def test_timeit_accepts_unhashable_timer():
+    class Clock:
+        __hash__ = None
+
+        def __call__(self):
+            return time.perf_counter()
+
+    assert timeit(timer=Clock())(abs)(-3) == 3
+
+
+def test_timeit_logs_at_debug_without_printing(caplog, capsys):
+    with caplog.at_level(logging.DEBUG, logger="wrapper_utils.wrapper_utils"):
+        assert timeit(abs)(-2) == 2
+    assert capsys.readouterr().out == ""
+    (record,) = caplog.records
+    assert record.levelno == logging.DEBUG
+    assert record.getMessage().startswith("abs executed in ")
+
+
+def test_timeit_verbose_prints(capsys):
+    timeit(verbose=True)(abs)(-2)
+    assert capsys.readouterr().out.startswith("abs executed in ")
+
+
+def test_timeit_handles_nameless_callables_and_braces(capsys):
+    def f():
+        pass
+
+    f.__name__ = "odd{name}"
+    timeit(verbose=True)(f)()
+    timeit(verbose=True)(functools.partial(abs, -1))()
+    out = capsys.readouterr().out.splitlines()
+    assert out[0].startswith("odd{name} executed in ")
+    assert out[1].startswith("functools.partial(")
+
+
+def test_timeit_forwards_underscore_keywords():
+    assert timeit(lambda **kwargs: kwargs)(_timer=1, _name=2) == {"_timer": 1, "_name": 2}
+
+
+# decorator
+
+@decorator
+def _scaled(func, *extra, factor=1, **options):
+    return func() * factor, extra, options
+
+
+def test_decorator_without_arguments():
+    assert _scaled(lambda: 2)() == (2, (), {})
+
+
+@pytest.mark.parametrize(
+    "dargs, dkwargs, expected",
+    [
+        ((), {}, (2, (), {})),
+        ((5,), {}, (2, (5,), {})),
+        ((), {"factor": 3}, (6, (), {})),
+        ((5,), {"factor": 3, "tag": "x"}, (6, (5,), {"tag": "x"})),
+    ],
+)
+def test_decorator_with_arguments(dargs, dkwargs, expected):
+    assert _scaled(*dargs, **dkwargs)(lambda: 2)() == expected
+
+
+def test_decorator_call_kwargs_override_decorator_kwargs():
+    wrapped = _scaled(factor=3)(lambda: 2)
+    assert wrapped(factor=5)[0] == 10
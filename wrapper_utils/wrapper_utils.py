@@ -1,78 +1,253 @@
 # wrapper_utils/wrapper_utils.py
 import functools
+import logging
+import os
+import threading
 import time
-import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_EXCEPTION, Executor, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Optional, Tuple, Type, Union
 
-_DEFAULT_POOL = ThreadPoolExecutor()
+_LOG = logging.getLogger(__name__)
 
+# What `catch` accepts as its `exception` argument
+ExceptionSpec = Union[Type[BaseException], Tuple[Type[BaseException], ...], List[Type[BaseException]]]
 
-def repeat(n=1):
+# Shared pool for `threaded_repeat`, created on first use by `_get_default_pool`
+_DEFAULT_POOL: Optional[ThreadPoolExecutor] = None
+_DEFAULT_POOL_LOCK = threading.Lock()
+
+# Message used by `timeit` both for `verbose` printing and for the debug log
+_TIMEIT_MSG = "%s executed in %s seconds"
+
+# Float-second clocks and their integer-nanosecond counterparts, used by `timeit`
+_NS_TIMERS = {
+    time.perf_counter: time.perf_counter_ns,
+    time.monotonic: time.monotonic_ns,
+    time.process_time: time.process_time_ns,
+    time.time: time.time_ns,
+}
+
+
+def _wraps(wrapper: Callable[..., Any], func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Lightweight stand-in for `functools.wraps`: copies the metadata of `func` straight onto `wrapper`
+    and returns it. Callables missing the usual function attributes fall back to
+    `functools.update_wrapper`.
+    """
+    try:
+        wrapper.__module__ = func.__module__
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__annotations__ = func.__annotations__
+    except AttributeError:
+        return functools.update_wrapper(wrapper, func)
+    # Python 3.12+ generic functions also carry their type parameters
+    type_params = getattr(func, "__type_params__", None)
+    if type_params:
+        wrapper.__type_params__ = type_params  # type: ignore[attr-defined]
+    func_dict = getattr(func, "__dict__", None)
+    if func_dict:
+        wrapper.__dict__.update(func_dict)
+    wrapper.__wrapped__ = func  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _default_max_workers() -> int:
+    """
+    Worker count for the default pool: `WRAPPER_UTILS_MAX_WORKERS` if it is set to a positive integer,
+    otherwise the CPU count. Invalid values are logged and ignored rather than failing the first
+    decorated call.
+    """
+    default = os.cpu_count() or 4
+    raw = os.environ.get("WRAPPER_UTILS_MAX_WORKERS")
+    if not raw:
+        return default
+    try:
+        max_workers = int(raw)
+    except ValueError:
+        max_workers = 0
+    if max_workers <= 0:
+        _LOG.warning("Ignoring WRAPPER_UTILS_MAX_WORKERS=%r: expected a positive integer, using %d workers",
+                     raw, default)
+        return default
+    return max_workers
+
+
+def _get_default_pool() -> ThreadPoolExecutor:
+    """
+    Return the shared `ThreadPoolExecutor` used by `threaded_repeat`, creating it on the first call so
+    importing the module never starts a pool nobody uses. The worker count comes from
+    `_default_max_workers`. Workers are named `wu_<n>` so they are easy to spot in profilers and thread
+    dumps. They are not daemon threads: like any `ThreadPoolExecutor`, queued work is finished before the
+    interpreter exits.
+    """
+    global _DEFAULT_POOL
+    if _DEFAULT_POOL is None:
+        with _DEFAULT_POOL_LOCK:
+            if _DEFAULT_POOL is None:
+                _DEFAULT_POOL = ThreadPoolExecutor(max_workers=_default_max_workers(), thread_name_prefix="wu")
+    return _DEFAULT_POOL
+
+
+def repeat(n: int = 1) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     The function `repeat` is a decorator that repeats the decorated function a specified number of
     times.
     @param n () - The `n` parameter in the `repeat` function is used to specify how many times a
     decorated function should be repeated when called. If `n` is set to 1, the function will not be
-    repeated and will be executed only once. If `n` is greater than 1,
+    repeated and will be executed only once. If `n` is 0 or negative, the function is never called and
+    the wrapper returns `None`. If `n` is greater than 1,
     @returns The `repeat` function is a decorator factory that returns a decorator based on the value of
     `n`. If `n` is equal to 1, it returns the original function without any wrapping. If `n` is greater
     than 1, it returns a wrapper function that calls the original function `n-1` times before calling it
     once more and returning the result.
     Danny - 12/04/2025
     """
-    def decorator_repeat(func):
+    def decorator_repeat(func: Callable[..., Any]) -> Callable[..., Any]:
         if n == 1:
             return func  # skip wrapper entirely for n=1
+        if n <= 0:
+            def wrapper_noop(*args: Any, **kwargs: Any) -> Any:
+                return None  # nothing to repeat
+
+            return _wraps(wrapper_noop, func)
 
-        @functools.wraps(func)
-        def wrapper_repeat(*args, **kwargs):
+        def wrapper_repeat(*args: Any, **kwargs: Any) -> Any:
             for _ in range(n - 1):
                 func(*args, **kwargs)
             return func(*args, **kwargs)
 
-        return wrapper_repeat
+        return _wraps(wrapper_repeat, func)
 
     return decorator_repeat
 
 
-def threaded_repeat(n=1, executor=None):
+def _run_repeated(job: Callable[[], Any], count: int) -> Any:
+    """
+    Call `job` `count` times in the current thread and return the result of the last call. Used by
+    `threaded_repeat` to run a whole chunk of calls as a single pool task.
+    """
+    for _ in range(count - 1):
+        job()
+    return job()
+
+
+def _chunk_sizes(n: int, pool: Executor) -> List[int]:
+    """
+    Split `n` calls into at most one chunk per worker of `pool`, as evenly as possible. Larger chunks
+    come first, so the final call always lands in the last chunk.
+    """
+    if n <= 0:
+        return []
+    workers = getattr(pool, "_max_workers", None) or os.cpu_count() or 1
+    chunks = min(n, workers)
+    size, extra = divmod(n, chunks)
+    return [size + 1] * extra + [size] * (chunks - extra)
+
+
+def _last_result(futures: List["Future[Any]"]) -> Any:
+    """
+    Wait for `futures` to finish, re-raising the first failure seen, and return the result of the last
+    one (or `None` if there are none).
+    """
+    if not futures:
+        return None
+
+    # Wait for all tasks to complete (or the first failure) and return the last one
+    wait(futures, return_when=FIRST_EXCEPTION)
+    # Check in submit order so the exception re-raised is the same one every time
+    for future in futures:
+        if future.done():
+            exc = future.exception()
+            if exc is not None:
+                raise exc
+    return futures[-1].result()
+
+
+def threaded_repeat(n: int = 1, executor: Optional[Executor] = None,
+                    mode: str = "each") -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     The `threaded_repeat` function is a decorator that allows a specified function to be executed
     concurrently multiple times using a thread pool.
     @param n () - The `n` parameter in the `threaded_repeat` function specifies the number of times the
     decorated function will be called concurrently. By default, it is set to 1, meaning the function
     will be called once. If you provide a different value for `n`, the function will be executed that
+    many times. With `n=1` and no `executor` the function is returned unchanged, so the single call
+    runs directly on the caller's thread rather than in the pool
     @param executor () - The `executor` parameter in the `threaded_repeat` function is used to specify
     the concurrent executor to be used for running the decorated function multiple times concurrently.
-    If no executor is provided, it defaults to `_DEFAULT_POOL`. This allows you to control how the
-    function calls are executed in a concurrent manner
+    If no executor is provided, it defaults to a shared pool that is created on first use. This allows
+    you to control how the function calls are executed in a concurrent manner
+    @param mode () - The `mode` parameter controls how the `n` calls are handed to the executor. With
+    `"each"` (the default) every call is submitted as its own task. With `"chunk"` the calls are split
+    into one batch per worker and each batch runs its share sequentially as a single task, which avoids
+    contending on the executor's queue when `n` is large or the function is short
     @returns The `threaded_repeat` function returns a decorator function that can be used to
     concurrently execute a given function `n` times using a specified executor (or a default one if not
     provided). The decorator submits `n` calls of the function concurrently to the executor, waits for
-    all tasks to complete, and returns the result of the last call.
+    all tasks to complete, and returns the result of the last call (except for `n=1` without an
+    executor, described above).
     Danny - 12/04/2025
     """
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            pool = executor or _DEFAULT_POOL
-            # Submit all n calls concurrently
-            futures = [pool.submit(func, *args, **kwargs) for _ in range(n)]
-            
-            # Wait for all tasks to complete and return the last one
-            last_result = None
-            for future in as_completed(futures):
-                last_result = future.result()
-            return last_result
-        
-        return wrapper
+    if mode not in ("each", "chunk"):
+        raise ValueError(f"mode must be 'each' or 'chunk', got {mode!r}")
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        # Resolve an explicit executor once here rather than on every call; the default pool is only
+        # looked up (and created) when the wrapper first runs, then cached here as well
+        pool_submit: Optional[Callable[..., "Future[Any]"]] = None
+        if executor is not None:
+            pool_submit = executor.submit
+
+        if n == 1:
+            if executor is None:
+                # Submitting to the shared thread pool and blocking on it is just a slower direct call
+                return func
+            submit_single = executor.submit
+
+            # A single call needs no bookkeeping, just submit it and wait
+            def wrapper_single(*args: Any, **kwargs: Any) -> Any:
+                return submit_single(func, *args, **kwargs).result()
+
+            return _wraps(wrapper_single, func)
+
+        if mode == "chunk":
+            # The chunk sizes only depend on n and the pool, so they are worked out once with it
+            sizes: Optional[List[int]] = _chunk_sizes(n, executor) if executor is not None else None
+
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                nonlocal pool_submit, sizes
+                if pool_submit is None or sizes is None:
+                    pool = _get_default_pool()
+                    sizes = _chunk_sizes(n, pool)
+                    pool_submit = pool.submit
+                job = functools.partial(func, *args, **kwargs) if args or kwargs else func
+                # One task per chunk: the queue is only touched once per worker, not once per call
+                futures = [pool_submit(_run_repeated, job, size) for size in sizes]
+                return _last_result(futures)
+        else:
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                nonlocal pool_submit
+                if pool_submit is None:
+                    pool_submit = _get_default_pool().submit
+                # Bind the arguments once so each submit doesn't have to unpack them again
+                job = functools.partial(func, *args, **kwargs) if args or kwargs else func
+                # Submit all n calls concurrently
+                futures = [pool_submit(job) for _ in range(n)]
+                return _last_result(futures)
+
+        return _wraps(wrapper, func)
     return decorator
 
 
-def catch(_func=None, *, exception=None, handler=None, silent=False):
+def catch(_func: Optional[Callable[..., Any]] = None, *, exception: Optional[ExceptionSpec] = None,
+          handler: Optional[Callable[[BaseException], Any]] = None, silent: bool = False) -> Callable[..., Any]:
     """
     The `catch` function in Python is a decorator that allows catching specified exceptions and either
-    printing the traceback or calling a custom handler while optionally suppressing the exception.
+    logging the traceback or calling a custom handler while optionally suppressing the exception.
+    Tracebacks go to the `wrapper_utils.wrapper_utils` logger at ERROR level; with no logging configured
+    Python still writes them to stderr, and attaching a handler or filter to that logger controls them.
     @param _func () - The `_func` parameter in the `catch` function is used to pass the target function
     that you want to decorate with the exception handling logic. If `_func` is provided, it means you
     are using the decorator with parentheses, and `_func` will be the target function to which the
@@ -83,11 +258,11 @@ def catch(_func=None, *, exception=None, handler=None, silent=False):
     tuple for catching multiple
     @param handler () - The `handler` parameter in the `catch` function is used to specify a custom
     function that will be called when an exception is caught. If a `handler` function is provided, it
-    will be called with the caught exception as its argument instead of printing the traceback. This
+    will be called with the caught exception as its argument instead of logging the traceback. This
     allows you to define custom
     @param silent () - The `silent` parameter in the `catch` function is a boolean flag that determines
     whether the exception should be handled silently or not. If `silent` is set to `True`, the exception
-    will be caught and no traceback will be printed or handler called. If `silent` is set to `
+    will be caught and no traceback will be logged or handler called. If `silent` is set to `
     @returns The `catch` function returns a decorator function if called with parentheses, or a
     decorator function applied to a target function if called without parentheses.
     Danny - 12/04/2025
@@ -99,22 +274,34 @@ def catch(_func=None, *, exception=None, handler=None, silent=False):
     if isinstance(exception, list):
         exception = tuple(exception)
 
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            try:
-                return func(*args, **kwargs)
-            except exception as e:
-                # If silent is False we either print the traceback or call the handler
-                if not silent:
-                    if handler:
-                        handler(e)
-                    else:
-                        traceback.print_exc()
-                # Swallow the exception – caller gets ``None``
-                return None
-
-        return wrapper
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        # Pick the wrapper body up front so the except block never has to check the flags.
+        # In every case the exception is swallowed and the caller gets ``None``.
+        if silent:
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return func(*args, **kwargs)
+                except exception:
+                    return None
+        elif handler is not None:
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return func(*args, **kwargs)
+                except exception as e:
+                    handler(e)
+                    return None
+        else:
+            name = getattr(func, "__name__", func)
+
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return func(*args, **kwargs)
+                except exception:
+                    # The traceback is only formatted if a handler actually emits the record
+                    _LOG.exception("caught in %s", name)
+                    return None
+
+        return _wraps(wrapper, func)
 
     # If the decorator is used without parentheses, ``_func`` is the target function.
     if _func is None:
@@ -123,7 +310,9 @@ def catch(_func=None, *, exception=None, handler=None, silent=False):
         return decorator(_func)
 
 
-def timeit(_func=None, *, timer=time.perf_counter, handler=None):
+def timeit(_func: Optional[Callable[..., Any]] = None, *,
+           timer: Callable[[], Union[int, float]] = time.perf_counter_ns,
+           handler: Optional[Callable[[str, float], Any]] = None, verbose: bool = False) -> Callable[..., Any]:
     """
     The `timeit` function is a decorator in Python that measures the execution time of a function and
     optionally calls a handler function with the timing information.
@@ -132,11 +321,16 @@ def timeit(_func=None, *, timer=time.perf_counter, handler=None):
     to that function. If `_func` is not provided, the `decorator_timeit`
     @param timer () - The `timer` parameter in the `timeit` function is used to specify the timer
     function that will be used to measure the execution time of the decorated function. By default, it
-    is set to `time.perf_counter`, which is a high-resolution timer function in the `time` module that
+    is set to `time.perf_counter_ns`. The standard float clocks (`time.perf_counter`, `time.process_time`,
+    ...) are swapped for their `_ns` variants, and nanosecond readings are converted to seconds before
+    being reported, so handlers always receive seconds. It is a high-resolution timer function that
     @param handler () - The `handler` parameter in the `timeit` function is used to specify a callback
     function that will be called after the execution of the decorated function. This callback function
     can be used to perform custom actions with the timing information of the function execution, such as
     logging the timing data to a file,
+    @param verbose () - The `verbose` parameter restores printing the timing to stdout on every call.
+    By default the timing is only sent to the `wrapper_utils.wrapper_utils` logger at DEBUG level, and
+    the message is not even formatted unless that level is enabled
     @returns The `timeit` function is a decorator that can be used to measure the execution time of
     another function. When called without any arguments, it returns the `decorator_timeit` function
     which is used as a decorator to measure the execution time of a function. When called with a
@@ -144,19 +338,28 @@ def timeit(_func=None, *, timer=time.perf_counter, handler=None):
     the decorated function
     Danny - 12/04/2025
     """
-    def decorator_timeit(func):
-        @functools.wraps(func)
-        def wrapper_timeit(*args, **kwargs):
-            start = timer()
+    # Integer nanosecond clocks avoid allocating a float for every reading. Match by identity so any
+    # callable, hashable or not, is accepted as a timer.
+    ns_timer = next((ns for clock, ns in _NS_TIMERS.items() if clock is timer), timer)
+    is_ns = any(ns_timer is ns for ns in _NS_TIMERS.values())
+
+    def decorator_timeit(func: Callable[..., Any]) -> Callable[..., Any]:
+        name = getattr(func, "__name__", None) or repr(func)
+
+        def wrapper_timeit(*args: Any, **kwargs: Any) -> Any:
+            start = ns_timer()
             ret = func(*args, **kwargs)
-            end = timer()
-            run_time = end - start
-            if handler:
-                handler(func.__name__, run_time)
-            print(f"{func.__name__} executed in {run_time} seconds")
+            end = ns_timer()
+            run_time = (end - start) / 1e9 if is_ns else end - start
+            if handler is not None:
+                handler(name, run_time)
+            if verbose:
+                print(_TIMEIT_MSG % (name, run_time))
+            elif _LOG.isEnabledFor(logging.DEBUG):
+                _LOG.debug(_TIMEIT_MSG, name, run_time)
             return ret
 
-        return wrapper_timeit
+        return _wraps(wrapper_timeit, func)
 
     if _func is None:
         return decorator_timeit
@@ -164,7 +367,7 @@ def timeit(_func=None, *, timer=time.perf_counter, handler=None):
         return decorator_timeit(_func)
 
 
-def decorator(func):
+def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
     """
     The `decorator` function is a versatile decorator that can be used with or without arguments to wrap
     other functions.
@@ -177,30 +380,40 @@ def decorator(func):
     actual decorator function that can be used to decorate
     Danny - 12/04/2025
     """
-    @functools.wraps(func)
-    def wrapper(*dargs, **dkwargs):
+    def wrapper(*dargs: Any, **dkwargs: Any) -> Any:
         # Simple usage: @something
         if len(dargs) == 1 and callable(dargs[0]) and not dkwargs:
             target = dargs[0]
 
-            @functools.wraps(target)
-            def wrapped(*a, **k):
+            def wrapped(*a: Any, **k: Any) -> Any:
                 return func(target, *a, **k)
 
-            return wrapped
+            return _wraps(wrapped, target)
         else:
             # Usage with arguments: @something(x=5)
-            def actual_decorator(target):
-                @functools.wraps(target)
-                def wrapped(*a, **k):
-                    # Merge positional args: decorator args first, then function call args
-                    all_args = dargs + a
-                    # Merge keyword args: decorator kwargs first, then function call kwargs
-                    all_kwargs = {**dkwargs, **k}
-                    return func(target, *all_args, **all_kwargs)
+            def actual_decorator(target: Callable[..., Any]) -> Callable[..., Any]:
+                # Only merge what the decorator was actually given, e.g. @something() merges nothing
+                if not dargs and not dkwargs:
+                    def wrapped(*a: Any, **k: Any) -> Any:
+                        return func(target, *a, **k)
+                elif not dkwargs:
+                    def wrapped(*a: Any, **k: Any) -> Any:
+                        # Merge positional args: decorator args first, then function call args
+                        return func(target, *dargs, *a, **k)
+                elif not dargs:
+                    def wrapped(*a: Any, **k: Any) -> Any:
+                        # Merge keyword args: decorator kwargs first, then function call kwargs
+                        return func(target, *a, **{**dkwargs, **k})
+                else:
+                    def wrapped(*a: Any, **k: Any) -> Any:
+                        # Merge positional args: decorator args first, then function call args
+                        all_args = dargs + a
+                        # Merge keyword args: decorator kwargs first, then function call kwargs
+                        all_kwargs = {**dkwargs, **k}
+                        return func(target, *all_args, **all_kwargs)
 
-                return wrapped
+                return _wraps(wrapped, target)
 
             return actual_decorator
 
-    return wrapper
+    return _wraps(wrapper, func)